@@ -24,6 +24,7 @@ VERSION_FILE = ".setupmeta.version"  # File used to work with projects that are
 SCM_DESCRIBE = "SCM_DESCRIBE"  # Name of env var used as pass-through for cases where git checkout is not available
 TESTING = False  # Set to True while running tests
 RE_SPACES = re.compile(r"\s+", re.MULTILINE)
+WHICH_CACHE = {}  # Programs found in PATH, avoids walking PATH again each time the same program is ran (git for example)
 
 PLATFORM = platform.system().lower()
 WINDOWS = "windows" in PLATFORM
@@ -81,13 +82,6 @@ def short(text, c=None):
     return result
 
 
-def strip_dash(text):
-    """ Strip leading dashes from 'text' """
-    if not text:
-        return text
-    return text.strip("-")
-
-
 def is_executable(path):
     if WINDOWS:  # pragma: no cover
         return path and os.path.isfile(path) and path.endswith(".exe")
@@ -103,9 +97,15 @@ def which(program):
         if is_executable(program):
             return program
         return None
-    for p in os.environ.get("PATH", "").split(os.pathsep):
+    path = os.environ.get("PATH", "")
+    key = (program, path)
+    fp = WHICH_CACHE.get(key)
+    if fp and is_executable(fp):
+        return fp
+    for p in path.split(os.pathsep):
         fp = os.path.join(p, program)
         if is_executable(fp):
+            WHICH_CACHE[key] = fp
             return fp
     ppath = project_path(program)
     if is_executable(ppath):
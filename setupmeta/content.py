@@ -25,6 +25,9 @@ def load_contents(relative_path, limit=0):
         try:
             full_path = setupmeta.project_path(relative_path)
             with io.open(full_path, "rt") as fh:
+                if not limit:
+                    return fh.read().strip()
+
                 lines = []
                 for line in fh:
                     limit -= 1
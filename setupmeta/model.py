@@ -395,17 +395,15 @@ class PackageInfo:
             return
 
         # Parse PKG-INFO when present
-        line_number = 0
         key = None
-        for line in lines.split("\n"):
-            line_number += 1
+        for line_number, line in enumerate(lines.split("\n"), start=1):
             if line.startswith(" "):
                 self.info[key].append(line[8:])
                 continue
 
-            if ": " in line:
-                key, _, value = line.partition(": ")
-                key = self.canonical_key(key)
+            name, sep, value = line.partition(": ")
+            if sep:
+                key = self.canonical_key(name)
                 if key is None:
                     continue
                 if key in self._list_types:
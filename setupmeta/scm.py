@@ -1,11 +1,51 @@
 import os
 import re
-from distutils.version import LooseVersion
 
 import setupmeta
 
 
-RE_GIT_DESCRIBE = re.compile(r"^v?(.+?)(-\d+)?(-g\w+)?(-dirty)?$", re.IGNORECASE)  # Output expected from git describe
+RE_VERSION_COMPONENT = re.compile(r"(\d+|[a-z]+|\.)")  # Same components as distutils' LooseVersion
+
+
+def parsed_describe(text):
+    """
+    Parse output of 'git describe', expected form: v{main}-{distance}-g{commitid}-dirty (all parts but {main} optional)
+    Optional parts are peeled off from the right, no regex (and thus no backtracking) involved
+
+    :param str|None text: Text to parse
+    :return (str, int, str|None, bool)|None: Main, distance, commitid and dirty parts, if 'text' could be parsed
+    """
+    if text and text[-1] == "\n":
+        text = text[:-1]
+
+    if not text or "\n" in text:
+        return None
+
+    if len(text) > 1 and text[0] in "vV":
+        text = text[1:]
+
+    distance = 0
+    commitid = None
+    dirty = False
+    main, _, tail = text.rpartition("-")
+    if main and tail.lower() == "dirty":
+        dirty = True
+        text = main
+        main, _, tail = text.rpartition("-")
+
+    if main and len(tail) > 1 and tail[0] in "gG" and all(c.isalnum() or c == "_" for c in tail[1:]):
+        commitid = tail
+        text = main
+        main, _, tail = text.rpartition("-")
+
+    if main and tail.isdigit():
+        # isdigit() also holds for characters int() rejects (such as superscripts), those are part of {main}
+        tail = setupmeta.to_int(tail)
+        if tail is not None:
+            distance = tail
+            text = main
+
+    return text, distance, commitid, dirty
 
 
 class Scm:
@@ -44,6 +84,10 @@ class Scm:
         """
         pass
 
+    def clear_cache(self):
+        """Forget cached state (such as current version), called before modifying the checkout"""
+        pass
+
     def commit_files(self, commit, push, relative_paths, next_version):
         """
         Commit modified files with 'relative_paths', commit message will be of the form "Version v1.0.0"
@@ -106,9 +150,8 @@ class Snapshot(Scm):
 
     def is_dirty(self):
         v = os.environ.get(setupmeta.SCM_DESCRIBE)
-        if v and "dirty" in v:
-            return True
-        return False
+        version = v and Git.parsed_version(v)
+        return bool(version and version.dirty)
 
     def get_branch(self):
         """Consider branch to be always HEAD for snapshots"""
@@ -128,6 +171,7 @@ class Git(Scm):
 
     program = "git"
     _has_origin = None
+    _version = None  # Computed once per process, checkout is not expected to change while setup.py runs (see clear_cache())
 
     def _get_tags(self, *cmd):
         text = self.get_output(*cmd)
@@ -149,17 +193,13 @@ class Git(Scm):
 
     @staticmethod
     def parsed_version(text, dirty=None):
-        if text:
-            m = RE_GIT_DESCRIBE.match(text)
-            if m:
-                main = m.group(1)
-                distance = setupmeta.strip_dash(m.group(2))
-                distance = setupmeta.to_int(distance, default=0)
-                commitid = setupmeta.strip_dash(m.group(3))
-                if dirty is None:
-                    # This is only settable via env var SCM_DESCRIBE
-                    dirty = m.group(4) == "-dirty"
-                return Version(main, distance, commitid, dirty, text)
+        parts = parsed_describe(text)
+        if parts:
+            main, distance, commitid, described_dirty = parts
+            if dirty is None:
+                # This is only settable via env var SCM_DESCRIBE
+                dirty = described_dirty
+            return Version(main, distance, commitid, dirty, text)
         return None
 
     def is_dirty(self):
@@ -178,12 +218,39 @@ class Git(Scm):
         branch = self.get_output("rev-parse", "--abbrev-ref", "HEAD")
         return branch and branch.strip()
 
+    def clear_cache(self):
+        self._version = None
+
     def get_version(self):
-        dirty = self.is_dirty()
+        if self._version is None:
+            cmd = self.describe_command()
+            self._version = self.described_version(cmd, self.get_output(*cmd))
+        return self._version
+
+    @staticmethod
+    def describe_command():
+        """
+        :return list(str): 'git describe' command to use to determine current version
+        """
         # Allow to override git describe command via env var SETUPMETA_GIT_DESCRIBE_COMMAND (just in case)
         cmd = os.environ.get("SETUPMETA_GIT_DESCRIBE_COMMAND", "describe --dirty --tags --long --match *.* --first-parent")
-        cmd = cmd.split(" ")
-        text = self.get_output(*cmd)
+        return cmd.split(" ")
+
+    def described_version(self, cmd, text):
+        """
+        :param list(str) cmd: 'git describe' command that was ran
+        :param str text: Output of 'cmd'
+        :return Version: Corresponding version
+        """
+        parts = parsed_describe(text)
+        if parts and not parts[3] and "--dirty" in cmd:
+            # 'git describe --dirty' already reports a clean checkout, no need to run 'git diff'
+            dirty = False
+
+        else:
+            # Double-check via is_dirty(), as it ignores submodules (and describe may not have been ran with --dirty)
+            dirty = self.is_dirty()
+
         version = self.parsed_version(text, dirty)
         if version:
             return version
@@ -230,20 +297,45 @@ class Git(Scm):
                 print("Not running 'git push --tags origin' as you don't have an origin")
 
 
-class Version:
+class MainVersion(object):
     """
-    Version broken down for setupmeta usage purposes
+    'main' part of a version, renders and exposes its components like distutils' LooseVersion used to
     """
 
-    text = None         # type: str # Full text of version as received
-    version = None      # type: LooseVersion # Distutils LooseVersion object representing the 'main' part
+    __slots__ = [
+        "vstring",  # type: str # Text of the 'main' part (example: "1.2rc3")
+        "version",  # type: list # Components of the 'main' part, numbers as int (example: [1, 2, "rc", 3])
+    ]
+
+    def __init__(self, vstring):
+        """
+        :param str vstring: Text of the 'main' part of a version
+        """
+        self.vstring = vstring
+        self.version = [setupmeta.to_int(c, default=c) for c in RE_VERSION_COMPONENT.split(vstring) if c and c != "."]
+
+    def __repr__(self):
+        return "MainVersion ('%s')" % self.vstring
+
+    def __str__(self):
+        return self.vstring
+
+
+class Version(object):
+    """
+    Version broken down for setupmeta usage purposes
+    """
 
-    major = 0           # type: int # Major part of version
-    minor = 0           # type: int # Minor part of version
-    patch = 0           # type: int # Patch part of version
-    distance = 0        # type: int # Number of commits since last version tag
-    commitid = None     # type: str # Commit id
-    dirty = ""          # type: str # Dirty marker
+    __slots__ = [
+        "text",           # type: str # Full text of version as received
+        "version",        # type: MainVersion # Object representing the 'main' part
+        "major",          # type: int # Major part of version
+        "minor",          # type: int # Minor part of version
+        "patch",          # type: int # Patch part of version
+        "distance",       # type: int # Number of commits since last version tag
+        "commitid",       # type: str # Commit id
+        "dirty",          # type: str # Dirty marker
+    ]
 
     def __init__(self, main=None, distance=0, commitid=None, dirty=False, text=None):
         """
@@ -258,11 +350,8 @@ class Version:
         self.dirty = ".dirty" if dirty else ""
         main = (main or "0.0.0").strip()
         self.text = text or "v%s-%s-%s" % (main, self.distance, self.commitid)
-        self.version = LooseVersion(main)
-        triplet = self.bump_triplet()
-        self.major = triplet[0]
-        self.minor = triplet[1]
-        self.patch = triplet[2]
+        self.version = MainVersion(main)
+        self.major, self.minor, self.patch = (self.version.version + [0, 0, 0])[:3]
 
     def __repr__(self):
         return self.text
@@ -271,11 +360,7 @@ class Version:
         """
         :return int, int, int: Major, minor, patch
         """
-        version = list(self.version.version)
-        major = version and version.pop(0) or 0
-        minor = version and version.pop(0) or 0
-        patch = version and version.pop(0) or 0
-        return major, minor, patch
+        return self.major, self.minor, self.patch
 
     @property
     def post(self):
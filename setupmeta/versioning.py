@@ -1,24 +1,40 @@
+import collections
 import io
 import os
 import re
+import shutil
+import tempfile
 
 import setupmeta
+from setupmeta.content import load_contents
 from setupmeta.scm import Git, Snapshot, Version
 
 
 BUMPABLE = "major minor patch".split()
 RE_VERSIONING = re.compile(r"^(branch(\([\w\s,\-]+\))?:)?(.*?)([ +@#%^/]!?(.*))?(;(.*))?$")
+SCM_ROOTS = {}  # Cached find_scm_root() hits, see _clear_scm_roots_cache()
+
+
+def _clear_scm_roots_cache():
+    """Forget SCM roots found so far (useful if folder structure changed, in tests for example)"""
+    SCM_ROOTS.clear()
 
 
 def find_scm_root(root, name):
     if not root:
         return None
+    key = (root, name)
+    if key in SCM_ROOTS:
+        return SCM_ROOTS[key]
     if os.path.isdir(os.path.join(root, name)):
-        return root
-    parent = os.path.dirname(root)
-    if parent == root:
-        return None
-    return find_scm_root(parent, name)
+        result = root
+    else:
+        parent = os.path.dirname(root)
+        result = None if parent == root else find_scm_root(parent, name)
+    if result:
+        # Only hits are cached, so that a checkout created later on (via 'git init' for example) is still found
+        SCM_ROOTS[key] = result
+    return result
 
 
 def project_scm(root):
@@ -174,13 +190,14 @@ class Strategy:
     def formatted(branches, main, separator, extra):
         if isinstance(branches, list):
             branches = ",".join(branches)
-        result = ""
+        parts = []
         if main:
-            result += setupmeta.stringify(main)
-        if result or extra:
-            result += setupmeta.stringify(separator)
+            parts.append(setupmeta.stringify(main))
+        if main or extra:
+            parts.append(setupmeta.stringify(separator))
         if extra:
-            result += setupmeta.stringify(extra)
+            parts.append(setupmeta.stringify(extra))
+        result = "".join(parts)
         if branches:
             result = "branch(%s):%s" % (branches, result)
         return result
@@ -400,8 +417,11 @@ class Versioning:
         gv = self.scm.get_version()
         if self.generate_version_file:
             path = setupmeta.project_path(setupmeta.VERSION_FILE)
-            with open(path, "w") as fh:
-                fh.write("%s" % gv)
+            text = "%s" % gv
+            if load_contents(setupmeta.VERSION_FILE) != text:
+                # setup.py typically gets invoked several times in a row, rewrite version file only when needed
+                with open(path, "w") as fh:
+                    fh.write(text)
 
         if gv.patch and "patch" not in self.strategy.bumpable:
             msg = "patch version component should be .0 for versioning strategy '%s', " % self.strategy
@@ -443,6 +463,8 @@ class Versioning:
         if self.problem:
             setupmeta.abort(self.problem)
 
+        # Don't rely on a previously computed version, bump needs to see current state of checkout
+        self.scm.clear_cache()
         branch = simulate_branch or self.scm.get_branch()
         if branch not in self.strategy.branches:
             setupmeta.abort("Can't bump branch '%s', need one of %s" % (branch, self.strategy.branches))
@@ -477,39 +499,55 @@ class Versioning:
             setupmeta.run_program(hook, self.meta.name, branch, next_version, fatal=True, dryrun=not commit, cwd=setupmeta.project_path())
 
     def update_sources(self, next_version, commit, push, vdefs):
-        modified = []
+        """
+        :param str next_version: Version to write in source files
+        :param bool commit: Effectively modify (and commit) source files if True, dryrun otherwise
+        :param bool push: Effectively push if True
+        :param setupmeta.model.Definition vdefs: Definitions of 'version' found in project
+        """
+        # Several definitions often live in the same file (example: setup.py), read and write each file only once
+        targets = collections.OrderedDict()
         for vdef in vdefs.sources:
             if ".py:" not in vdef.source:
                 continue
 
             relative_path, _, target_line = vdef.source.partition(":")
-            full_path = setupmeta.project_path(relative_path)
             target_line = setupmeta.to_int(target_line, default=0)
+            targets.setdefault(relative_path, []).append((target_line, vdef))
 
+        modified = []
+        for relative_path, file_targets in targets.items():
+            pending = dict(file_targets)
+            revisions = {}
             lines = []
-            changed = 0
-            line_number = 0
-            revised = None
+            full_path = setupmeta.project_path(relative_path)
             with io.open(full_path, "rt") as fh:
-                for line in fh.readlines():
-                    line_number += 1
-                    if line_number == target_line:
+                for line_number, line in enumerate(fh, start=1):
+                    vdef = pending.pop(line_number, None)
+                    if vdef is not None:
                         revised = updated_line(line, next_version, vdef)
-                        if revised and revised != line:
-                            changed += 1
+                        if revised != line:
+                            revisions[line_number] = revised
                             line = revised
+
                     lines.append(line)
+                    if not pending:
+                        lines.extend(fh)  # No need to look at remaining lines
+                        break
 
-            if not changed:
-                print("%s already has the right version" % vdef.source)
+            for target_line, vdef in file_targets:
+                revised = revisions.get(target_line)
+                if not revised:
+                    print("%s already has the right version" % vdef.source)
 
-            else:
+                elif not commit:
+                    print("Would update %s with: %s" % (vdef.source, revised.strip()))
+
+            if revisions:
+                # Files are rewritten only when at least one line effectively changed
                 modified.append(relative_path)
                 if commit:
-                    with io.open(full_path, "wt") as fh:
-                        fh.writelines(lines)
-                else:
-                    print("Would update %s with: %s" % (vdef.source, revised.strip()))
+                    write_atomically(full_path, lines)
 
         if not modified:
             return
@@ -517,6 +555,34 @@ class Versioning:
         self.scm.commit_files(commit, push, modified, next_version)
 
 
+def write_atomically(full_path, lines):
+    """
+    Write 'lines' to a temp file, then rename it to 'full_path'
+    This way, 'full_path' is never left half-written (for example if bump gets interrupted)
+
+    :param str full_path: Path to file to write
+    :param list(str) lines: Lines to write
+    """
+    real_path = os.path.realpath(full_path)  # Write through symlinks, rather than replacing them
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(real_path))
+    try:
+        with io.open(fd, "wt") as fh:
+            fh.writelines(lines)
+
+        shutil.copymode(real_path, temp_path)  # Preserve permissions (setup.py can be executable for example)
+        if hasattr(os, "replace"):
+            os.replace(temp_path, real_path)
+
+        else:  # pragma: no cover, python2
+            if setupmeta.WINDOWS:
+                os.remove(real_path)  # os.rename() does not overwrite existing files on Windows
+            os.rename(temp_path, real_path)
+
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)  # Don't leave a stray temp file behind if anything above failed
+
+
 def updated_line(line, next_version, vdef):
     line = line.strip()
     sep = "=" if "=" in line else ":"
@@ -197,12 +197,16 @@ class MockGit(Git):
         self.commitid = commitid
         self._local_tags = local_tags
         self._remote_tags = remote_tags
+        self.commands = []  # Commands ran so far, useful to verify which git calls were made
         Git.__init__(self, TESTS)
 
     def get_output(self, cmd, *args, **kwargs):
+        self.commands.append(cmd)
         if cmd.startswith("diff"):
             return 1 if self.dirty else 0
         if cmd == "describe":
+            if self.describe and self.dirty and "--dirty" in args:
+                return "%s-dirty" % self.describe
             return self.describe
         if cmd == "rev-parse":
             if "--abbrev-ref" in args:
@@ -33,12 +33,6 @@ def test_shortening():
     assert setupmeta.merged("a", "b") == "a\nb"
 
 
-def test_strip():
-    assert setupmeta.strip_dash(None) is None
-    assert setupmeta.strip_dash("foo") == "foo"
-    assert setupmeta.strip_dash("--foo-") == "foo"
-
-
 def test_listify():
     assert setupmeta.listify("a, b") == ["a,", "b"]
     assert setupmeta.listify("a,  b") == ["a,", "b"]
@@ -69,7 +63,10 @@ def test_which():
     assert setupmeta.which(None) is None
     assert setupmeta.which("/foo/does/not/exist") is None
     assert setupmeta.which("foo/does/not/exist") is None
-    assert setupmeta.which("pip")
+    pip = setupmeta.which("pip")
+    assert pip
+    assert pip in setupmeta.WHICH_CACHE.values()
+    assert setupmeta.which("pip") == pip
 
 
 def test_run_program():
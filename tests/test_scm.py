@@ -1,3 +1,7 @@
+import os
+
+from mock import patch
+
 import setupmeta.scm
 
 from . import conftest
@@ -12,6 +16,55 @@ def test_scm():
     assert scm.get_output() is None
 
 
+def test_git_version_cache(sample_project):
+    git = setupmeta.scm.Git(sample_project)
+    version = git.get_version()
+    assert not version.dirty
+
+    with open("sample.py", "w") as fh:
+        fh.write("print('hello')\n")
+
+    assert git.get_version() is version  # Cached
+
+    git.clear_cache()
+    version = git.get_version()
+    assert version.dirty
+    assert git.get_version() is version
+
+
+def test_git_dirty_check():
+    git = conftest.MockGit(dirty=False)
+    assert not git.get_version().dirty
+    assert git.commands == ["describe"]  # 'git describe --dirty' reported a clean checkout, no 'git diff' needed
+
+    git = conftest.MockGit(dirty=True)
+    assert git.get_version().dirty
+    assert git.commands == ["describe", "diff"]  # '-dirty' suffix is confirmed via 'git diff'
+
+    with patch.dict(os.environ, {"SETUPMETA_GIT_DESCRIBE_COMMAND": "describe --tags --long"}):
+        git = conftest.MockGit(dirty=False)
+        assert not git.get_version().dirty
+        assert git.commands == ["describe", "diff", "diff"]  # describe can't tell without --dirty
+
+
+def test_git_commit_and_tag(sample_project):
+    git = setupmeta.scm.Git(sample_project)
+    with open("sample.py", "w") as fh:
+        fh.write("print('hello')\n")
+
+    with conftest.capture_output() as out:
+        git.commit_files(True, True, ["sample.py"], "0.2.0")
+        git.apply_tag(True, True, "0.2.0")
+        assert "Running: git add sample.py" in out
+        assert 'Running: git commit -m "Version 0.2.0"' in out
+        assert 'Running: git tag -a v0.2.0 -m "Version 0.2.0"' in out
+        assert "Won't push: no origin defined" in out
+        assert "Not running 'git push --tags origin' as you don't have an origin" in out
+
+    assert not git.is_dirty()
+    assert git.get_output("describe", "--tags") == "v0.2.0"
+
+
 def test_git():
     git = conftest.MockGit(describe=None, commitid="abc123")
     assert str(git.get_version()) == "v0.0.0-1-gabc123"
@@ -42,3 +95,33 @@ def test_git():
 
         assert "Would run: git push origin" not in out
         assert "Would run: git push --tags origin" not in out
+
+
+def test_version():
+    version = setupmeta.scm.Version("1.2rc3")
+    assert version.version.version == [1, 2, "rc", 3]
+    assert str(version.version) == "1.2rc3"
+    assert repr(version.version) == "MainVersion ('1.2rc3')"
+    assert version.bump_triplet() == (1, 2, "rc")
+    assert str(version) == "v1.2rc3-0-g0000000"
+    assert not hasattr(version, "__dict__")
+
+    version = setupmeta.scm.Version()
+    assert version.version.version == [0, 0, 0]
+    assert setupmeta.scm.Version("5").bump_triplet() == (5, 0, 0)
+
+
+def test_parsed_describe():
+    assert setupmeta.scm.parsed_describe(None) is None
+    assert setupmeta.scm.parsed_describe("") is None
+    assert setupmeta.scm.parsed_describe("v1.0\nv2.0") is None
+    assert setupmeta.scm.parsed_describe("v1.2.3-4-g1234567-dirty") == ("1.2.3", 4, "g1234567", True)
+    assert setupmeta.scm.parsed_describe("v1.2.3-4-g1234567\n") == ("1.2.3", 4, "g1234567", False)
+    assert setupmeta.scm.parsed_describe("V1.0-DIRTY") == ("1.0", 0, None, True)
+    assert setupmeta.scm.parsed_describe("1.0-5") == ("1.0", 5, None, False)
+    assert setupmeta.scm.parsed_describe("1.0-g12-3") == ("1.0-g12", 3, None, False)
+    assert setupmeta.scm.parsed_describe("v") == ("v", 0, None, False)
+    assert setupmeta.scm.parsed_describe("v-5") == ("-5", 0, None, False)
+    assert setupmeta.scm.parsed_describe("v1-g") == ("1-g", 0, None, False)
+    assert setupmeta.scm.parsed_describe(u"v1.0-\u00b2") == (u"1.0-\u00b2", 0, None, False)
+    assert setupmeta.scm.Git.parsed_version(u"v1.0-\u00b2-g123").distance == 0
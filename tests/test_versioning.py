@@ -29,12 +29,27 @@ def test_disabled():
 
 
 def test_project_scm():
+    setupmeta.versioning._clear_scm_roots_cache()
     assert setupmeta.versioning.find_scm_root(None, ".git") is None
     assert setupmeta.versioning.find_scm_root("", ".git") is None
     assert setupmeta.versioning.find_scm_root("/", ".git") is None
     assert setupmeta.versioning.find_scm_root(conftest.TESTS, ".git") == conftest.PROJECT_DIR
     assert setupmeta.versioning.find_scm_root(conftest.resouce("scenarios", "complex", "src", "complex"), ".git") == conftest.PROJECT_DIR
 
+    with setupmeta.temp_resource() as temp:
+        folder = os.path.join(temp, "foo")
+        os.mkdir(folder)
+        assert setupmeta.versioning.find_scm_root(folder, ".scm") is None
+
+        os.mkdir(os.path.join(temp, ".scm"))
+        assert setupmeta.versioning.find_scm_root(folder, ".scm") == temp  # Misses are not cached
+
+        os.rmdir(os.path.join(temp, ".scm"))
+        assert setupmeta.versioning.find_scm_root(folder, ".scm") == temp  # Hits are cached
+
+        setupmeta.versioning._clear_scm_roots_cache()
+        assert setupmeta.versioning.find_scm_root(folder, ".scm") is None
+
 
 def test_snapshot_with_version_file():
     with setupmeta.temp_resource() as temp:
@@ -53,8 +68,11 @@ def test_snapshot_with_version_file():
         assert versioning.scm.get_branch() == "HEAD"
 
         # Trigger artificial rewriting of version file
+        version_file = os.path.join(temp, setupmeta.VERSION_FILE)
+        os.utime(version_file, (0, 0))
         versioning.generate_version_file = True
         versioning.auto_fill_version()
+        assert os.path.getmtime(version_file) == 0  # Same content, not rewritten
 
 
 @patch.dict(os.environ, {setupmeta.SCM_DESCRIBE: "1"})
@@ -246,6 +264,19 @@ def test_distance_marker():
         assert str(versioning.strategy) == "branch(master):{major}.{minor}.{distance}{dirty}"
 
 
+def test_version_marker():
+    with conftest.capture_output():
+        meta = new_meta("{version}.{distance}", scm=conftest.MockGit())
+        versioning = meta.versioning
+        assert not versioning.problem
+        assert not versioning.strategy.problem
+        check_render(versioning, "1.2rc3.4", main="1.2rc3", distance=4)
+        check_render(versioning, "1.0.0", main="1.0", distance=0)
+
+        meta = new_meta("{version_tuple}", scm=conftest.MockGit())
+        assert meta.versioning.strategy.problem == "invalid versioning part 'version_tuple'"
+
+
 @patch.dict(os.environ, {"BUILD_ID": "543"})
 def test_preconfigured_build_id(*_):
     """Verify that short notations expand to the expected format"""
@@ -397,6 +428,35 @@ def test_git_versioning(sample_project):
     assert output == "0.2.0"
 
 
+def test_write_atomically():
+    with setupmeta.temp_resource() as temp:
+        path = os.path.join(temp, "setup.py")
+        write_to_file(path, "version = '1.0'")
+        os.chmod(path, 0o755)
+        setupmeta.versioning.write_atomically(path, ["version = '1.1'\n", "# comment\n"])
+        if not setupmeta.WINDOWS:
+            assert os.stat(path).st_mode & 0o777 == 0o755
+        assert os.listdir(temp) == ["setup.py"]
+        with open(path) as fh:
+            assert fh.read() == "version = '1.1'\n# comment\n"
+
+        with patch("shutil.copymode", side_effect=OSError("oops")):
+            with pytest.raises(OSError):
+                setupmeta.versioning.write_atomically(path, ["version = '1.2'\n"])
+        assert os.listdir(temp) == ["setup.py"]  # Temp file was cleaned up
+        with open(path) as fh:
+            assert fh.read() == "version = '1.1'\n# comment\n"
+
+        if not setupmeta.WINDOWS:
+            link = os.path.join(temp, "link.py")
+            os.symlink(path, link)
+            setupmeta.versioning.write_atomically(link, ["version = '1.3'\n"])
+            assert os.path.islink(link)
+            assert sorted(os.listdir(temp)) == ["link.py", "setup.py"]
+            with open(path) as fh:
+                assert fh.read() == "version = '1.3'\n"
+
+
 def test_missing_tags():
     with conftest.capture_output() as out:
         meta = new_meta("distance", scm=conftest.MockGit(False, local_tags="v1.0\nv1.1", remote_tags="v1.0\nv2.0"))